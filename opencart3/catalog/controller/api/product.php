@@ -8,7 +8,13 @@ class ControllerApiProduct extends Controller
         $json             = array();
         $json['products'] = array();
         $filter_data      = array();
-        $results          = $this->model_catalog_product->getProducts($filter_data);
+
+        if (isset($this->request->get['limit'])) {
+            $filter_data['start'] = isset($this->request->get['start']) ? (int) $this->request->get['start'] : 0;
+            $filter_data['limit'] = (int) $this->request->get['limit'];
+        }
+
+        $results = $this->model_catalog_product->getProducts($filter_data);
         foreach ($results as $result) {
             if ($this->config->get('config_review_status')) {
                 $rating = (int) $result['rating'];
@@ -26,7 +32,7 @@ class ControllerApiProduct extends Controller
                 $stock        = $this->language->get('1');
                 $availability = "instock";
             }
-            $data['products'][] = array(
+            $json['products'][] = array(
                 'product_id' => $result['product_id'],
                 'name' => $result['name'],
                 'model' => $result['model'],
@@ -39,8 +45,6 @@ class ControllerApiProduct extends Controller
             );
         }
         
-        
-        $json['products'] = $data['products'];
         $this->response->addHeader('Content-Type: application/json');
         $this->response->setOutput(json_encode($json));
     }